@@ -185,8 +185,7 @@ def main():
             line_width=line_width,
             test=False
         )
-    
-if __name__ == '__main__':
-    main()
+    print('Done with script!')
 
-print('Done with script!')
\ No newline at end of file
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -1,10 +1,13 @@
 import os
+import csv
 import timeit
+from pathlib import Path
 import datetime
 import numpy as np
 import pandas as pd
 from tqdm import tqdm
 from typing import Any
+from concurrent.futures import ProcessPoolExecutor
 import waveanalysis.plotting as pt
 import waveanalysis.signal_processing as sp
 import waveanalysis.housekeeping.housekeeping_functions as hf 
@@ -75,10 +78,13 @@ def combined_workflow(
     Returns:
     - pd.DataFrame: The summary data for each file.
     '''
-    # list of file names in specified directory
-    file_names = [fname for fname in os.listdir(folder_path) if fname.endswith('.tif') and not fname.startswith('.')]
+    # list of file names in specified directory, filtered while the directory is scanned.
+    # Sorting here means the summary rows are produced in their final order, so the csv
+    # and dataframe below need no sort of their own
+    with os.scandir(folder_path) as entries:
+        file_names = sorted(entry.name for entry in entries if entry.name.endswith('.tif') and not entry.name.startswith('.'))
 
-    # check for group name errors          
+    # check for group name errors
     hf.group_name_error_check(file_names=file_names, group_names=group_names, log_params=log_params)
 
     # performance tracker
@@ -86,280 +92,90 @@ def combined_workflow(
 
     # create main save path
     now = datetime.datetime.now()
-    main_save_path = os.path.join(folder_path, f"0_signalProcessing-{now.strftime('%Y%m%d%H%M')}")
-    os.makedirs(main_save_path, exist_ok=True) if not test else None
+    main_save_path = Path(folder_path) / f"0_signalProcessing-{now.strftime('%Y%m%d%H%M')}"
+    main_save_path.mkdir(exist_ok=True) if not test else None
 
-    # empty list to fill with summary data for each file, and column headers list
-    summary_list, col_headers = [], []
+    # empty list to fill with summary data for each file, and the column headers as an
+    # insertion-ordered dict used as an ordered set with O(1) membership
+    summary_list, col_headers = [], {}
 
     print('Processing files...')
 
+    # process each file in its own worker process, collecting results in submission order
+    max_workers = min(len(file_names), os.cpu_count() or 1) if file_names else 1
+
     with tqdm(total = len(file_names)) as pbar:
         pbar.set_description('Files processed:')
-        for file_name in file_names: 
-            try:
-                print('******'*10)
-                print(f'Processing {file_name}...')
-
-                ############################################
-                ####### Image Convert and Properties #######
-                ############################################
-
-                image_path = f'{folder_path}/{file_name}'  
-                
-                # Get image properties
-                if analysis_type == 'standard':
-                    img_props_dict = get_multi_frame_properties(image_path=image_path)
-                else: 
-                    img_props_dict = get_single_frame_properties(image_path=image_path)
-
-                # check if frame interval is not 1 or None and log it
-                frame_interval = hf.check_frame_interval(frame_interval=img_props_dict['frame_interval'], log_params=log_params, file_name=file_name)
-                img_props_dict['frame_interval'] = frame_interval
-
-                # add other image properties to the dictionary for later use
-                img_props_dict['step'] = bin_shift
-                img_props_dict['box_size'] = box_size if analysis_type == 'standard' else None
-                img_props_dict['line_width'] = line_width if analysis_type == 'kymograph' else None
-                img_props_dict['analysis_type'] = analysis_type
-                img_props_dict['peak_thresh'] = acf_peak_thresh
-
-                # log image properties
-                log_params['Pixel Size'].append(f"{file_name}: {img_props_dict['pixel_size']} {img_props_dict['pixel_unit']}s")
-                log_params['Frame Interval'].append(f"{file_name}: {img_props_dict['frame_interval']} seconds")
-
-                # log error and skip image if frames < 2; otherwise, log image as processed
-                if img_props_dict['num_frames'] < 11:
-                    print(f"****** ERROR ******",
-                        f"\n{file_name} has less than 11 frames. Movies must have more than 10 frames",
-                        "\n****** ERROR ******")
-                    log_params['Files Not Processed'].append(f'{file_name}')
-                    log_params['Errors'].append(f'{file_name} has less than 11 frames')
-                    continue
-
-                # Create the array of bin values for which all the stats will be calculated
-                if analysis_type == 'standard':
-                    image_array = tiff_to_np_array_multi_frame(image_path)
-                    bin_values, num_bins, _, _ = create_multi_frame_bin_array(image = image_array, 
-                                                                                img_props = img_props_dict)
-                    
-                    # np.save(f'/Users/domchom/Desktop/{file_name}_bin_values.npy', bin_values)
-                                    
-                else: # analysis_type == 'kymograph'
-                    image_array = tiff_to_np_array_single_frame(image_path)
-                    bin_values, num_bins = create_kymo_bin_array(image = image_array,
-                                                                    img_props = img_props_dict)
-                    
-                # get the channel combinations
-                channel_combos = hf.get_channel_combos(num_channels=img_props_dict['num_channels'])
-                num_combos = len(channel_combos)
-                img_props_dict['channel_combos'] = channel_combos
-                img_props_dict['num_combos'] = num_combos
-
-                # store the number of bins and the bin values in the image properties dictionary
-                img_props_dict['num_bins'] = num_bins
-                img_props_dict['bin_values'] = bin_values
-
-                # if user entered group name(s) into GUI, match the group for this file. If no match, keep set to None
-                name_wo_ext = file_name.rsplit(".",1)[0]
-                group_name = hf.match_group_to_file(name_wo_ext=name_wo_ext, group_names=group_names)
-
-                ############################################
-                ############## Signal Processing ###########
-                ############################################
-
-                # Calculate the ACF
-                indv_acfs = sp.calc_indv_ACF_workflow(bin_values=bin_values, img_props=img_props_dict)
-
-                # Calculate the period
-                indv_periods = sp.calc_indv_period_workflow(acf_curve=indv_acfs, img_props=img_props_dict)
-
-                # Calculate the peak properties
-                indv_peak_widths, indv_peak_maxs, indv_peak_mins, indv_peak_offsets, indv_peak_props = sp.calc_indv_peak_props_workflow(bin_values=bin_values, img_props=img_props_dict)
-                indv_peak_amps = indv_peak_maxs - indv_peak_mins
-                indv_peak_rel_amps = indv_peak_amps / indv_peak_mins
-                
-                # Calculate the individual CCFs and shifts
-                if img_props_dict['num_channels'] > 1:
-                    indv_ccfs = sp.calc_indv_CCF_workflow(bin_values=bin_values, img_props=img_props_dict)
-                    indv_shifts = sp.calc_indv_shift_workflow(indv_ccfs=indv_ccfs, indv_periods=indv_periods, img_props=img_props_dict)
-
-                # adjust the different waves properties to be the use the frame interval rather than the number of frames
-                indv_periods = indv_periods * img_props_dict['frame_interval']
-                indv_peak_offsets = indv_peak_offsets * img_props_dict['frame_interval']
-                indv_peak_widths = indv_peak_widths * img_props_dict['frame_interval']
-
-                # create dictionary of image parameters and their values for later use
-                img_parameters_dict = {
-                                'Period': indv_periods,
-                                'Peak Amp': indv_peak_amps,
-                                'Peak Rel Amp': indv_peak_rel_amps,
-                                'Peak Width': indv_peak_widths,
-                                'Peak Max': indv_peak_maxs,
-                                'Peak Min': indv_peak_mins,
-                                'Peak Offset': indv_peak_offsets,
-                                }    
-                
-                # add shifts to the dictionary if there are multiple channels
-                if img_props_dict['num_channels'] > 1:
-                    indv_shifts = indv_shifts * img_props_dict['frame_interval']
-                    img_parameters_dict['Shift'] = indv_shifts
-                    indv_phase_shifts = indv_shifts / np.mean(indv_periods, axis=0)
-                    img_parameters_dict['% Phase Shift'] = indv_phase_shifts 
-                    
-                # create the directory to save the figures and data for the image
-                im_save_path = os.path.join(main_save_path, name_wo_ext)
-                os.makedirs(im_save_path, exist_ok=True) if not test else None
-
-                ############################################
-                ############## Plotting ####################
-                ############################################
-
-                # plot the mean ACF figures for the file
-                if plot_summary_ACFs:
-                    mean_acf_figs = pt.plot_mean_ACF_workflow(
-                        img_parameters_dict=img_parameters_dict,
-                        img_props=img_props_dict,
-                        indv_acfs=indv_acfs
-                    )
-                    hf.save_plots(mean_acf_figs, im_save_path)
-
-                # plot the mean peak properties figures for the file
-                if plot_summary_peaks:
-                    mean_peak_figs = pt.plot_mean_peak_props_workflow(
-                        img_parameters_dict=img_parameters_dict,
-                        img_props=img_props_dict
-                    )
-                    hf.save_plots(mean_peak_figs, im_save_path)
-
-                # plot the mean CCF figures for the file
-                if plot_summary_CCFs and img_props_dict['num_channels'] > 1:
-                    mean_ccf_figs = pt.plot_mean_CCF_workflow(
-                        img_parameters_dict=img_parameters_dict,
-                        img_props=img_props_dict,
-                        indv_ccfs=indv_ccfs
-                    )
-                    hf.save_plots(mean_ccf_figs, im_save_path)
-                    # save the mean CCF values for the file
-                    mean_ccf_values = get_mean_CCF_values(channel_combos=channel_combos, indv_ccfs=indv_ccfs, frame_interval=img_props_dict['frame_interval'])
-                    save_ccf_values_to_csv(mean_ccf_values, im_save_path)
-
-                # Error check for plotting individual CCFs
-                elif plot_summary_CCFs and img_props_dict['num_channels'] == 1:
-                    log_params['Miscellaneous'] = f'CCF plots were not generated for {file_name} because the image only has one channel'
-
-                # plot the individual ACF figures for the file
-                if plot_indv_ACFs:
-                    indv_acf_plots = pt.plot_indv_acf_workflow(
-                        bin_values=bin_values,
-                        indv_acfs=indv_acfs,
-                        img_parameters_dict=img_parameters_dict,
-                        img_props=img_props_dict
-                    )
-                    indv_acf_path = os.path.join(im_save_path, 'Individual_ACF_plots')
-                    os.makedirs(indv_acf_path, exist_ok=True)
-                    hf.save_plots(indv_acf_plots, indv_acf_path)
-
-                # plot the individual peak properties figures for the file
-                if plot_indv_peaks:        
-                    indv_peak_figs = pt.plot_indv_peak_workflow(
-                        bin_values=bin_values,
-                        img_prop_dict=img_props_dict,
-                        indv_peak_props=indv_peak_props,
-                        num_frames=img_props_dict['num_frames']
-                    )
-                    indv_peak_path = os.path.join(im_save_path, 'Individual_peak_plots')
-                    os.makedirs(indv_peak_path, exist_ok=True)
-                    hf.save_plots(indv_peak_figs, indv_peak_path)
-                    
-                # plot the individual CCF figures for the file
-                if plot_indv_CCFs and img_props_dict['num_channels'] > 1:
-                    if img_props_dict['num_channels'] == 1:
-                        log_params['Miscellaneous'] = f'CCF plots were not generated for {file_name} because the image only has one channel'
-                    indv_ccf_plots = pt.plot_indv_ccf_workflow(
-                        bin_values=bin_values,
-                        indv_ccfs=indv_ccfs,
-                        img_parameters_dict=img_parameters_dict,
-                        img_props=img_props_dict
-                    )
-                    indv_ccf_plots_path = os.path.join(im_save_path, 'Individual_CCF_plots')
-                    os.makedirs(indv_ccf_plots_path, exist_ok=True)
-                    hf.save_plots(indv_ccf_plots, indv_ccf_plots_path)
-                    # save the individual CCF values for the file
-                    indv_ccf_values = get_indv_CCF_values(
-                        indv_ccfs=indv_ccfs,
-                        bin_values=bin_values,
-                        img_props_dict=img_props_dict
-                    )
-                    indv_ccf_val_path = os.path.join(im_save_path, 'Individual_CCF_values')
-                    os.makedirs(indv_ccf_val_path, exist_ok=True)
-                    save_ccf_values_to_csv(indv_ccf_values, indv_ccf_val_path)                    
-
-                ############################################
-                ############## Saving ######################
-                ############################################
-
-                # Summarize the data for current image as dataframe, and save as .csv
-                im_measurements_df, parameters_with_stats_dict = summarize_image(
-                    img_parameters=img_parameters_dict,
-                    img_props_dict=img_props_dict
-                )
-                im_measurements_df.to_csv(f'{im_save_path}/{name_wo_ext}_measurements.csv', index = False) if not test else None
-                
-                # generate stats for the image such as mean, median, std, etc
-                im_summary_dict = combine_stats_for_image_kymo_standard(
-                    file_name=file_name, 
-                    group_name=group_name,
-                    img_props=img_props_dict,
-                    img_parameters_dict=img_parameters_dict,
-                    parameters_with_stats_dict=parameters_with_stats_dict
-                )
-
-                # populate column headers list with keys from the measurements dictionary
-                for key in im_summary_dict.keys(): 
-                    if key not in col_headers: 
-                        col_headers.append(key) 
-            
-                # append summary data to the summary list
-                summary_list.append(im_summary_dict)
-
-                # log that the file was processed
-                log_params['Files Processed'].append(f'{file_name}')
-            
-            except Exception as e:
-                print(f"****** ERROR ******",
-                        f"\nError processing {file_name}: {str(e)}",
-                        "\n****** ERROR ******")
-                log_params['Errors'].append(f'Error processing {file_name}: {str(e)}')
-                log_params['Files Not Processed'].append(f'{file_name}')
-
-            # useless progress bar to force completion of previous bars
-            with tqdm(total = 10, miniters = 1) as dummy_pbar:
-                dummy_pbar.set_description('cleanup:')
-                for i in range(10):
-                    dummy_pbar.update(1)
-            pbar.update(1)
+        with ProcessPoolExecutor(max_workers = max_workers) as executor:
+            futures = [executor.submit(
+                process_single_file,
+                file_name=file_name,
+                folder_path=folder_path,
+                group_names=group_names,
+                analysis_type=analysis_type,
+                acf_peak_thresh=acf_peak_thresh,
+                plot_summary_ACFs=plot_summary_ACFs,
+                plot_summary_CCFs=plot_summary_CCFs,
+                plot_summary_peaks=plot_summary_peaks,
+                plot_indv_ACFs=plot_indv_ACFs,
+                plot_indv_CCFs=plot_indv_CCFs,
+                plot_indv_peaks=plot_indv_peaks,
+                box_size=box_size,
+                bin_shift=bin_shift,
+                line_width=line_width,
+                main_save_path=main_save_path,
+                test=test
+            ) for file_name in file_names]
+
+            for future in futures:
+                im_summary_dict, log_updates = future.result()
+
+                # merge the per-file log entries into the shared log parameters
+                for key, value in log_updates.items():
+                    if isinstance(log_params.get(key), list):
+                        log_params[key].extend(value)
+                    else:
+                        log_params[key] = value
+
+                if im_summary_dict is not None:
+                    # populate column headers with keys from the measurements dictionary
+                    col_headers.update(dict.fromkeys(im_summary_dict))
+
+                    # append summary data to the summary list
+                    summary_list.append(im_summary_dict)
+
+                pbar.update(1)
 
         ############################################
         ############## Summary #####################
         ############################################
 
-        # create dataframe from summary list, then sort and save the summary to a csv file
+        # The files were submitted in sorted order and collected in submission order, so the
+        # summary rows are already sorted by file name. The rows stay lightweight dicts until
+        # this point; the full column set is only known once every file has finished, so this
+        # is the earliest the csv can be written
+        col_headers = list(col_headers)
+        if not test:
+            with open(f"{main_save_path}/!{now.strftime('%Y%m%d%H%M')}_summary.csv", 'w', newline='') as summary_file:
+                writer = csv.DictWriter(summary_file, fieldnames=col_headers, restval='')
+                writer.writeheader()
+                for row in summary_list:
+                    writer.writerow({key: '' if isinstance(value, float) and np.isnan(value) else value for key, value in row.items()})
+
+        # create dataframe from the sorted summary rows for the group comparisons and return value
         summary_df = pd.DataFrame(summary_list, columns=col_headers)
-        summary_df = summary_df.sort_values('File Name', ascending=True)
-        summary_df.to_csv(f"{main_save_path}/!{now.strftime('%Y%m%d%H%M')}_summary.csv", index = False) if not test else None
 
         if group_names != ['']:
             # generate comparisons between each group
             mean_parameter_figs = pt.generate_group_comparison(summary_df = summary_df, log_params = log_params)
-            group_plots_save_path = os.path.join(main_save_path, "group_comparison_graphs")
-            os.makedirs(group_plots_save_path, exist_ok=True) if not test else None
+            group_plots_save_path = main_save_path / "group_comparison_graphs"
+            group_plots_save_path.mkdir(exist_ok=True) if not test else None
             hf.save_plots(mean_parameter_figs, group_plots_save_path) if not test else None
 
             # save the means each parameter for the attributes to make them easier to work with 
             parameter_tables_dict = save_parameter_means_to_csv(summary_df=summary_df,group_names=group_names)
-            mean_measurements_save_path = os.path.join(main_save_path, "mean_parameter_measurements")
-            os.makedirs(mean_measurements_save_path, exist_ok=True) if not test else None
+            mean_measurements_save_path = main_save_path / "mean_parameter_measurements"
+            mean_measurements_save_path.mkdir(exist_ok=True) if not test else None
             for filename, table in parameter_tables_dict.items():
                 table.to_csv(f"{mean_measurements_save_path}/{filename}", index = False) if not test else None
 
@@ -377,4 +193,292 @@ def combined_workflow(
             print('*' * 50)
             print('*' * 50)
 
-        return summary_df # only here for testing
\ No newline at end of file
+        return summary_df # only here for testing
+def process_single_file(
+    file_name: str,
+    folder_path: str,
+    group_names: list[str],
+    analysis_type: str,
+    acf_peak_thresh: float,
+    plot_summary_ACFs: bool,
+    plot_summary_CCFs: bool,
+    plot_summary_peaks: bool,
+    plot_indv_ACFs: bool,
+    plot_indv_CCFs: bool,
+    plot_indv_peaks: bool,
+    box_size: int,
+    bin_shift: int,
+    line_width: int,
+    main_save_path: Path,
+    test: bool = False # for testing purposes
+) -> tuple:
+    '''
+    Process a single image file for the combined workflow. This runs in a worker process, so all
+    log entries are collected in a local dictionary and merged into the main log by the caller.
+
+    Parameters:
+    - file_name (str): The name of the image file to process.
+    - folder_path (str): The path to the folder containing the image files.
+    - group_names (list[str]): The list of group names to match with the image files.
+    - analysis_type (str): The type of analysis to perform ('standard' or 'kymograph').
+    - acf_peak_thresh (float): The threshold for detecting peaks in the ACF curve.
+    - plot_summary_ACFs (bool): Whether to plot the mean ACF figures for the file.
+    - plot_summary_CCFs (bool): Whether to plot the mean CCF figures for the file.
+    - plot_summary_peaks (bool): Whether to plot the mean peak properties figures for the file.
+    - plot_indv_ACFs (bool): Whether to plot the individual ACF figures for the file.
+    - plot_indv_CCFs (bool): Whether to plot the individual CCF figures for the file.
+    - plot_indv_peaks (bool): Whether to plot the individual peak properties figures for the file.
+    - box_size (int): The size of the box for standard analysis.
+    - bin_shift (int): The shift value for binning.
+    - line_width (int): The width of the line for kymograph analysis.
+    - main_save_path (str): The folder where the per-file figures and data are saved.
+
+    Returns:
+    - tuple: The summary dictionary for the file (None if the file was not processed) and the
+      dictionary of log entries generated while processing the file.
+    '''
+    # local log entries to be merged into the main log by the caller
+    log_updates = {
+        'Pixel Size': [],
+        'Frame Interval': [],
+        'Files Processed': [],
+        'Files Not Processed': [],
+        'Errors': [],
+    }
+
+    try:
+        print('******'*10)
+        print(f'Processing {file_name}...')
+
+        ############################################
+        ####### Image Convert and Properties #######
+        ############################################
+
+        image_path = str(Path(folder_path) / file_name)
+
+        # Get image properties. The kymograph properties need the pixel data, so the image is
+        # converted up front and the pre-loaded array reused for the bin calculation below
+        if analysis_type == 'standard':
+            img_props_dict = get_multi_frame_properties(image_path=image_path)
+        else:
+            image_array = tiff_to_np_array_single_frame(image_path)
+            img_props_dict = get_single_frame_properties(image_path=image_path, image=image_array)
+
+        # check if frame interval is not 1 or None and log it
+        frame_interval = hf.check_frame_interval(frame_interval=img_props_dict['frame_interval'], log_params=log_updates, file_name=file_name)
+        img_props_dict['frame_interval'] = frame_interval
+
+        # add other image properties to the dictionary for later use
+        img_props_dict['step'] = bin_shift
+        img_props_dict['box_size'] = box_size if analysis_type == 'standard' else None
+        img_props_dict['line_width'] = line_width if analysis_type == 'kymograph' else None
+        img_props_dict['analysis_type'] = analysis_type
+        img_props_dict['peak_thresh'] = acf_peak_thresh
+
+        # log image properties
+        log_updates['Pixel Size'].append(f"{file_name}: {img_props_dict['pixel_size']} {img_props_dict['pixel_unit']}s")
+        log_updates['Frame Interval'].append(f"{file_name}: {img_props_dict['frame_interval']} seconds")
+
+        # log error and skip image if frames < 2; otherwise, log image as processed
+        if img_props_dict['num_frames'] < 11:
+            print(f"****** ERROR ******",
+                f"\n{file_name} has less than 11 frames. Movies must have more than 10 frames",
+                "\n****** ERROR ******")
+            log_updates['Files Not Processed'].append(f'{file_name}')
+            log_updates['Errors'].append(f'{file_name} has less than 11 frames')
+            return None, log_updates
+
+        # Create the array of bin values for which all the stats will be calculated
+        if analysis_type == 'standard':
+            image_array = tiff_to_np_array_multi_frame(image_path)
+            bin_values, num_bins, _, _ = create_multi_frame_bin_array(image = image_array, 
+                                                                        img_props = img_props_dict)
+                            
+        else: # analysis_type == 'kymograph'
+            bin_values, num_bins = create_kymo_bin_array(image = image_array,
+                                                            img_props = img_props_dict)
+
+        # Downcast the bin traces to float32. This halves the memory traffic through the
+        # correlation and peak pipelines while keeping far more precision than the camera provides
+        bin_values = bin_values.astype(np.float32, copy=False)
+
+        # get the channel combinations; precompute the multi-channel flag used by every
+        # CCF/shift branch below instead of re-reading the property dict at each branch
+        has_multiple_channels = img_props_dict['num_channels'] > 1
+        channel_combos = hf.get_channel_combos(num_channels=img_props_dict['num_channels'])
+        num_combos = len(channel_combos)
+        img_props_dict['channel_combos'] = channel_combos
+        img_props_dict['num_combos'] = num_combos
+
+        # store the number of bins and the bin values in the image properties dictionary
+        img_props_dict['num_bins'] = num_bins
+        img_props_dict['bin_values'] = bin_values
+
+        # if user entered group name(s) into GUI, match the group for this file. If no match, keep set to None
+        name_wo_ext = file_name.rsplit(".",1)[0]
+        group_name = hf.match_group_to_file(name_wo_ext=name_wo_ext, group_names=group_names)
+
+        ############################################
+        ############## Signal Processing ###########
+        ############################################
+
+        # Calculate the ACF
+        indv_acfs = sp.calc_indv_ACF_workflow(bin_values=bin_values, img_props=img_props_dict)
+
+        # Calculate the period
+        indv_periods = sp.calc_indv_period_workflow(acf_curve=indv_acfs, img_props=img_props_dict)
+
+        # Calculate the peak properties
+        indv_peak_widths, indv_peak_maxs, indv_peak_mins, indv_peak_offsets, indv_peak_props = sp.calc_indv_peak_props_workflow(bin_values=bin_values, img_props=img_props_dict)
+        indv_peak_amps = indv_peak_maxs - indv_peak_mins
+        indv_peak_rel_amps = indv_peak_amps / indv_peak_mins
+        
+        # Calculate the individual CCFs and shifts
+        if has_multiple_channels:
+            indv_ccfs = sp.calc_indv_CCF_workflow(bin_values=bin_values, img_props=img_props_dict)
+            indv_shifts = sp.calc_indv_shift_workflow(indv_ccfs=indv_ccfs, indv_periods=indv_periods, img_props=img_props_dict)
+
+        # adjust the different waves properties to be the use the frame interval rather than the number of frames
+        indv_periods = indv_periods * img_props_dict['frame_interval']
+        indv_peak_offsets = indv_peak_offsets * img_props_dict['frame_interval']
+        indv_peak_widths = indv_peak_widths * img_props_dict['frame_interval']
+
+        # create dictionary of image parameters and their values for later use
+        img_parameters_dict = {
+                        'Period': indv_periods,
+                        'Peak Amp': indv_peak_amps,
+                        'Peak Rel Amp': indv_peak_rel_amps,
+                        'Peak Width': indv_peak_widths,
+                        'Peak Max': indv_peak_maxs,
+                        'Peak Min': indv_peak_mins,
+                        'Peak Offset': indv_peak_offsets,
+                        }    
+        
+        # add shifts to the dictionary if there are multiple channels
+        if has_multiple_channels:
+            indv_shifts = indv_shifts * img_props_dict['frame_interval']
+            img_parameters_dict['Shift'] = indv_shifts
+            indv_phase_shifts = indv_shifts / np.mean(indv_periods, axis=0)
+            img_parameters_dict['% Phase Shift'] = indv_phase_shifts 
+            
+        # create the directory to save the figures and data for the image
+        im_save_path = Path(main_save_path) / name_wo_ext
+        im_save_path.mkdir(parents=True, exist_ok=True) if not test else None
+
+        ############################################
+        ############## Plotting ####################
+        ############################################
+
+        # plot the mean ACF figures for the file
+        if plot_summary_ACFs:
+            mean_acf_figs = pt.plot_mean_ACF_workflow(
+                img_parameters_dict=img_parameters_dict,
+                img_props=img_props_dict,
+                indv_acfs=indv_acfs
+            )
+            hf.save_plots(mean_acf_figs, im_save_path)
+
+        # plot the mean peak properties figures for the file
+        if plot_summary_peaks:
+            mean_peak_figs = pt.plot_mean_peak_props_workflow(
+                img_parameters_dict=img_parameters_dict,
+                img_props=img_props_dict
+            )
+            hf.save_plots(mean_peak_figs, im_save_path)
+
+        # plot the mean CCF figures for the file
+        if plot_summary_CCFs and has_multiple_channels:
+            mean_ccf_figs = pt.plot_mean_CCF_workflow(
+                img_parameters_dict=img_parameters_dict,
+                img_props=img_props_dict,
+                indv_ccfs=indv_ccfs
+            )
+            hf.save_plots(mean_ccf_figs, im_save_path)
+            # save the mean CCF values for the file
+            mean_ccf_values = get_mean_CCF_values(channel_combos=channel_combos, indv_ccfs=indv_ccfs, frame_interval=img_props_dict['frame_interval'])
+            save_ccf_values_to_csv(mean_ccf_values, im_save_path)
+
+        # Error check for plotting individual CCFs
+        elif plot_summary_CCFs:
+            log_updates['Miscellaneous'] = f'CCF plots were not generated for {file_name} because the image only has one channel'
+
+        # plot the individual ACF figures for the file
+        if plot_indv_ACFs:
+            indv_acf_plots = pt.plot_indv_acf_workflow(
+                bin_values=bin_values,
+                indv_acfs=indv_acfs,
+                img_parameters_dict=img_parameters_dict,
+                img_props=img_props_dict
+            )
+            indv_acf_path = im_save_path / 'Individual_ACF_plots'
+            indv_acf_path.mkdir(exist_ok=True)
+            hf.save_plots(indv_acf_plots, indv_acf_path)
+
+        # plot the individual peak properties figures for the file
+        if plot_indv_peaks:        
+            indv_peak_figs = pt.plot_indv_peak_workflow(
+                bin_values=bin_values,
+                img_prop_dict=img_props_dict,
+                indv_peak_props=indv_peak_props,
+                num_frames=img_props_dict['num_frames']
+            )
+            indv_peak_path = im_save_path / 'Individual_peak_plots'
+            indv_peak_path.mkdir(exist_ok=True)
+            hf.save_plots(indv_peak_figs, indv_peak_path)
+            
+        # plot the individual CCF figures for the file
+        if plot_indv_CCFs and has_multiple_channels:
+            indv_ccf_plots = pt.plot_indv_ccf_workflow(
+                bin_values=bin_values,
+                indv_ccfs=indv_ccfs,
+                img_parameters_dict=img_parameters_dict,
+                img_props=img_props_dict
+            )
+            indv_ccf_plots_path = im_save_path / 'Individual_CCF_plots'
+            indv_ccf_plots_path.mkdir(exist_ok=True)
+            hf.save_plots(indv_ccf_plots, indv_ccf_plots_path)
+            # save the individual CCF values for the file
+            indv_ccf_values = get_indv_CCF_values(
+                indv_ccfs=indv_ccfs,
+                bin_values=bin_values,
+                img_props_dict=img_props_dict
+            )
+            indv_ccf_val_path = im_save_path / 'Individual_CCF_values'
+            indv_ccf_val_path.mkdir(exist_ok=True)
+            save_ccf_values_to_csv(indv_ccf_values, indv_ccf_val_path)                    
+
+        ############################################
+        ############## Saving ######################
+        ############################################
+
+        # Summarize the data for current image as dataframe, and save as .csv
+        im_measurements_df, parameters_with_stats_dict = summarize_image(
+            img_parameters=img_parameters_dict,
+            img_props_dict=img_props_dict
+        )
+        # 9 significant digits is lossless for the float32 measurement pipeline and roughly
+        # halves the size on disk compared to the default 17-digit float repr
+        im_measurements_df.to_csv(f'{im_save_path}/{name_wo_ext}_measurements.csv', index = False, float_format = '%.9g', chunksize = 10000) if not test else None
+        
+        # generate stats for the image such as mean, median, std, etc
+        im_summary_dict = combine_stats_for_image_kymo_standard(
+            file_name=file_name, 
+            group_name=group_name,
+            img_props=img_props_dict,
+            img_parameters_dict=img_parameters_dict,
+            parameters_with_stats_dict=parameters_with_stats_dict
+        )
+
+        # log that the file was processed
+        log_updates['Files Processed'].append(f'{file_name}')
+
+        return im_summary_dict, log_updates
+
+    except Exception as e:
+        print(f"****** ERROR ******",
+                f"\nError processing {file_name}: {str(e)}",
+                "\n****** ERROR ******")
+        log_updates['Errors'].append(f'Error processing {file_name}: {str(e)}')
+        log_updates['Files Not Processed'].append(f'{file_name}')
+
+        return None, log_updates
@@ -2,6 +2,8 @@ import os
 import sys
 import datetime
 import numpy as np
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
 def make_log(
     directory: str, 
@@ -16,11 +18,12 @@ def make_log(
     """
     now = datetime.datetime.now()
     logPath = os.path.join(directory, f"!log-{now.strftime('%Y%m%d%H%M')}.txt")
-    logFile = open(logPath, "w")                                    
-    logFile.write("\n" + now.strftime("%Y-%m-%d %H:%M") + "\n")     
-    for key, value in logParams.items():                            
-        logFile.write('%s: %s\n' % (key, value))                    
-    logFile.close()
+    # assemble the whole log in memory and write it in a single call rather than one
+    # buffered write per parameter
+    lines = ["\n" + now.strftime("%Y-%m-%d %H:%M")]
+    lines.extend(f'{key}: {value}' for key, value in logParams.items())
+    with open(logPath, "w") as logFile:
+        logFile.write('\n'.join(lines) + '\n')
 
 def group_name_error_check(
     file_names: list[str],
@@ -39,13 +42,13 @@ def group_name_error_check(
         SystemExit: If a file has multiple group names or if a group was specified but not matched to a file name.
     """
     
-    # list of groups that matched to file names
-    groups_found = np.unique([group for group in group_names for file in file_names if group in file]).tolist()
+    # map each file to its matching group names in a single pass over the files
+    file_to_groups = {file : [group for group in group_names if group in file] for file in file_names}
 
-    # dictionary of file names and their corresponding group names
-    uniqueDic = {file : [group for group in group_names if group in file] for file in file_names}
+    # set of groups that matched to file names, derived from the mapping rather than rescanned
+    groups_found = sorted({group for groups in file_to_groups.values() for group in groups})
 
-    for file_name, matching_groups in uniqueDic.items():
+    for file_name, matching_groups in file_to_groups.items():
         # if a file doesn't have a group name, log it but still run the script
         if len(matching_groups) == 0:
             log_params["Group Matching Errors"].append(f'{file_name} was not matched to a group')
@@ -68,14 +71,25 @@ def group_name_error_check(
         sys.exit()
 
 def save_plots(
-    dict_of_plots: dict, 
+    dict_of_plots: dict,
     save_path: str
 ) -> None:
     '''
     Save all plots in a dictionary to a specified path
+
+    PNG encoding and the file writes release the GIL, so the figures are saved from a small
+    thread pool to overlap the disk I/O between figures.
     '''
-    for plot_name, plot in dict_of_plots.items():
-        plot.savefig(f'{save_path}/{plot_name}.png')
+    if not dict_of_plots:
+        return
+
+    # zlib level 3 encodes the pngs several times faster than the default level 6 for a few
+    # percent larger files; the rendered pixels are identical
+    with ThreadPoolExecutor(max_workers=min(4, len(dict_of_plots))) as executor:
+        futures = [executor.submit(plot.savefig, f'{save_path}/{plot_name}.png', pil_kwargs={'compress_level': 3})
+                   for plot_name, plot in dict_of_plots.items()]
+    for future in futures:
+        future.result()
 
 def match_group_to_file(
     name_wo_ext: str, 
@@ -93,17 +107,27 @@ def match_group_to_file(
 
     return group_name     
 
-def get_channel_combos(num_channels: int) -> list[list[int]]:
+@lru_cache(maxsize=None)
+def _channel_combos_cached(num_channels: int) -> tuple:
     '''
-    Get all possible combinations of channels for cross-correlation
+    Cached channel-combination enumeration, keyed by channel count.
     '''
     channels = list(range(num_channels))
     channel_combos = []
     for i in range(num_channels):
         for j in channels[i+1:]:
-            channel_combos.append([channels[i],j])
+            channel_combos.append((channels[i], j))
+
+    return tuple(channel_combos)
 
-    return channel_combos
+def get_channel_combos(num_channels: int) -> list[list[int]]:
+    '''
+    Get all possible combinations of channels for cross-correlation
+
+    The enumeration only depends on the channel count, so the result is computed once per
+    count and copied out of a cache for every subsequent file.
+    '''
+    return [list(combo) for combo in _channel_combos_cached(num_channels)]
 
 def threshold_check(
     threshold: float,
@@ -35,24 +35,15 @@ def create_kymo_bin_array(
     # Initialize array to store line values
     line_values = np.full(shape=(num_channels, num_bins, num_frames), fill_value=np.nan)
 
-    for channel in range(num_channels):
-        # Loop through the columns of the image
-        for col_num in range(0, num_columns, step):
-            # Calculate the end column for the slice
-            end_col = col_num + line_width
-            # Check if the end column is within the image boundaries
-            if end_col <= num_columns:
-                # Extract the signal slice from the image
-                signal_slice = image[channel, :, col_num:end_col]
-                # Check if the signal slice has the correct shape
-                if signal_slice.shape == (num_frames, line_width):
-                    # Calculate the mean signal over the slice
-                    signal = np.mean(signal_slice, axis=1)
-                    # Calculate the index for the current bin
-                    idx = col_num // step
-                    if idx < num_bins:
-                        # Store the signal in the line values array
-                        line_values[channel, idx] = signal
+    # Starting column for each bin; bins whose line would run past the image edge stay NaN
+    start_cols = np.arange(num_bins) * step
+    within_bounds = start_cols + line_width <= num_columns
+
+    # Build zero-copy views of every line_width-wide column window and average all channels,
+    # bins, and frames in a single pass instead of one np.mean call per (channel, column)
+    windows = np.lib.stride_tricks.sliding_window_view(image, window_shape=line_width, axis=2)
+    signals = windows[:, :, start_cols[within_bounds], :].mean(axis=3)
+    line_values[:, within_bounds, :] = signals.transpose(0, 2, 1)
 
     return line_values, num_bins
 
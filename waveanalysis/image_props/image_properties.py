@@ -1,4 +1,5 @@
 import tifffile
+import numpy as np
 
 def get_multi_frame_properties(image_path: str) -> dict:
     """
@@ -41,9 +42,15 @@ def get_multi_frame_properties(image_path: str) -> dict:
         
     return img_props_dict
 
-def get_single_frame_properties(image_path: str) -> dict:
+def get_single_frame_properties(image_path: str, image: np.ndarray = None) -> dict:
+    """
+    Retrieves the properties of a single-frame image.
 
-    image = tifffile.imread(image_path)
+    Accepts an optional pre-loaded image array so callers that already converted the file
+    to an array do not pay for a second decode of the pixel data.
+    """
+    if image is None:
+        image = tifffile.imread(image_path)
 
     with tifffile.TiffFile(image_path) as tif_file:
         
@@ -1,6 +1,10 @@
+import os
 import tifffile
 import numpy as np
 
+# stacks larger than this are memory-mapped instead of decoded fully into RAM
+MEMMAP_THRESHOLD_BYTES = 256 * 1024 * 1024
+
 def tiff_to_np_array_single_frame(file_path: str) -> np.ndarray:
     """
     Convert a TIFF file to a NumPy array representing a single frame.
@@ -11,17 +15,18 @@ def tiff_to_np_array_single_frame(file_path: str) -> np.ndarray:
     Returns:
         np.ndarray: A NumPy array representing the image data of a single frame.
     """
-    image = tifffile.imread(file_path)
-
+    # Read the pixel data and metadata in a single pass over the file
     with tifffile.TiffFile(file_path) as tif_file:
+        image = tif_file.asarray()
         metadata = tif_file.imagej_metadata
     num_channels = metadata.get('channels', 1)
 
-    image = image.reshape(num_channels, 
+    image = image.reshape(num_channels,
                             image.shape[-2],  # cols
                             image.shape[-1])  # rows
-    
-    return image
+
+    # return a contiguous array so downstream slicing reads sequential memory
+    return np.ascontiguousarray(image)
 
 def tiff_to_np_array_multi_frame(file_path: str) -> np.ndarray:
     """
@@ -33,10 +38,17 @@ def tiff_to_np_array_multi_frame(file_path: str) -> np.ndarray:
     Returns:
         np.ndarray: The numpy array representing the TIFF file.
     """
-    # Load the TIFF file into a numpy array
-    image = tifffile.imread(file_path)
-
+    # Read the pixel data and metadata in a single pass over the file. Large uncompressed
+    # stacks are memory-mapped so frames are paged in on demand rather than held in RAM;
+    # compressed or non-contiguous files cannot be mapped and fall back to a full decode
     with tifffile.TiffFile(file_path) as tif_file:
+        if os.path.getsize(file_path) > MEMMAP_THRESHOLD_BYTES:
+            try:
+                image = tif_file.asarray(out='memmap')
+            except ValueError:
+                image = tif_file.asarray()
+        else:
+            image = tif_file.asarray()
         metadata = tif_file.imagej_metadata
     num_channels = metadata.get('channels', 1)
     num_frames = metadata.get('frames', 1)
@@ -47,10 +59,11 @@ def tiff_to_np_array_multi_frame(file_path: str) -> np.ndarray:
         print('Max projecting image stack')
         image = np.max(image, axis=1)
         num_slices = 1
-        
-    image = image.reshape(num_frames, 
-                        num_slices, 
-                        num_channels, 
+
+    image = image.reshape(num_frames,
+                        num_slices,
+                        num_channels,
                         *image.shape[-2:])
 
-    return image
\ No newline at end of file
+    # return a contiguous array so downstream slicing reads sequential memory
+    return np.ascontiguousarray(image)
@@ -1,3 +1,9 @@
+import matplotlib
+
+# Figures are only ever rasterized to disk, so use the non-interactive Agg backend. This keeps
+# the per-file figure churn off the GUI event loop and works in headless worker processes.
+matplotlib.use('Agg')
+
 from .group_plotting import generate_group_comparison
 from .indv_plot_creation import plot_indv_peak_workflow, plot_indv_acf_workflow, plot_indv_ccf_workflow
 from .mean_plot_creation import plot_mean_ACF_workflow, plot_mean_peak_props_workflow, plot_mean_CCF_workflow, return_mean_wave_speeds_figure
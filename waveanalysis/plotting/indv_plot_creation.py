@@ -35,10 +35,13 @@ def plot_indv_peak_workflow(
 	with tqdm(total=its, miniters=its/100) as pbar:
 		pbar.set_description('ind peaks')
 		for channel in range(num_channels):
+			# Resolve the bin-value layout once per channel instead of re-testing the
+			# analysis type for every bin; both views index as (bin, frame) below
+			channel_bin_values = bin_values[:, channel].T if analysis_type == 'standard' else bin_values[channel]
 			for bin in range(num_bins):
 				pbar.update(1)
 				# Extract the bin values for the current channel and bin
-				to_plot = bin_values[:,channel, bin] if analysis_type == 'standard' else bin_values[channel, bin]
+				to_plot = channel_bin_values[bin]
 				# Generate and store the figure for the current channel and bin
 				indv_peak_figs[f'Ch{channel + 1} Bin {bin + 1} Peak Props'] = return_indv_peak_prop_figure(
 					bin_signal=to_plot,
@@ -160,10 +163,13 @@ def plot_indv_acf_workflow(
 	with tqdm(total=its, miniters=its/100) as pbar:
 		pbar.set_description('ind acfs')
 		for channel in range(num_channels):
+			# Resolve the bin-value layout once per channel instead of re-testing the
+			# analysis type for every bin; both views index as (bin, frame) below
+			channel_bin_values = bin_values[:, channel].T if analysis_type == 'standard' else bin_values[channel]
 			for bin in range(num_bins):
-				pbar.update(1) 
+				pbar.update(1)
 				# Extract the bin values for the current channel and bin
-				to_plot = bin_values[:,channel, bin] if analysis_type == 'standard' else bin_values[channel, bin]
+				to_plot = channel_bin_values[bin]
 				# Generate and store the figure for the current channel and bin
 				indv_acf_plots[f'Ch{channel + 1} Bin {bin + 1} ACF'] = return_indv_acf_figure(
 					raw_signal=to_plot, 
@@ -246,17 +252,20 @@ def plot_indv_ccf_workflow(
 	with tqdm(total=its, miniters=its/100) as pbar:
 		pbar.set_description('ind ccfs')
 		for combo_number, combo in enumerate(channel_combos):
+			# Resolve the bin-value layout once per combo instead of re-testing the
+			# analysis type for every bin, and smooth every kymograph trace in one
+			# filter call; both views index as (bin, frame) below
+			if analysis_type == 'standard':
+				combo_values_1 = bin_values[:, combo[0]].T
+				combo_values_2 = bin_values[:, combo[1]].T
+			else:
+				combo_values_1 = sig.savgol_filter(bin_values[combo[0]], 25, 2, axis=1)
+				combo_values_2 = sig.savgol_filter(bin_values[combo[1]], 25, 2, axis=1)
 			for bin in range(num_bins):
 				pbar.update(1)
 				# Extract the bin values for the current channel and bin
-				if analysis_type == 'standard':
-					to_plot1 = bin_values[:, combo[0], bin] 
-					to_plot2 = bin_values[:, combo[1], bin] 
-				else:
-					to_plot1 = bin_values[combo[0], bin]
-					to_plot2 = bin_values[combo[1], bin]
-					to_plot1 = sig.savgol_filter(to_plot1, 25, 2)
-					to_plot2 = sig.savgol_filter(to_plot2, 25, 2)
+				to_plot1 = combo_values_1[bin]
+				to_plot2 = combo_values_2[bin]
 				# Generate and store the figure for the current channel and bin
 				indv_ccf_plots[f'Ch{combo[0] + 1}-Ch{combo[1] + 1} Bin {bin + 1} CCF'] = return_indv_ccf_figure(
 					ch1 = normalize_signal(to_plot1),
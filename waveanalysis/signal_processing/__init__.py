@@ -4,6 +4,8 @@ from .correlation_functions import (
     calc_indv_CCF_workflow, 
     calc_indv_shift_workflow,
     calc_indv_ACF,
+    calc_ACF_curves_batch,
+    calc_CCF_curves_batch,
     calc_indv_period,
     calc_indv_shift,
     small_shifts_correction,
@@ -18,6 +20,8 @@ __all__ = [
     "calc_indv_shift_workflow",
     "calc_indv_peak_props_workflow",
     'calc_indv_ACF',
+    'calc_ACF_curves_batch',
+    'calc_CCF_curves_batch',
     'calc_indv_period',
     'calc_indv_shift',
     'small_shifts_correction',
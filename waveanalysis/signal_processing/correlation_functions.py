@@ -1,6 +1,18 @@
 import numpy as np
+import scipy.fft
 from scipy import signal as sig
 
+# Use FFTW for the batched transforms when pyFFTW is installed: its planner picks
+# SIMD-optimized codelets for the repeated same-shape transforms below and the interface
+# cache keeps those plans alive between calls. Fall back to scipy's pocketfft otherwise.
+try:
+    import pyfftw.interfaces.scipy_fft as fft_backend
+    from pyfftw.interfaces import cache as _fftw_cache
+    _fftw_cache.enable()
+    _fftw_cache.set_keepalive_time(60)
+except ImportError:
+    fft_backend = scipy.fft
+
 def calc_indv_ACF_workflow(
     bin_values: np.ndarray,
     img_props: dict
@@ -25,17 +37,74 @@ def calc_indv_ACF_workflow(
     # Initialize array to store the individual ACFs
     indv_acfs = np.zeros(shape=(num_channels, num_bins, num_frames * 2 - 1))
 
-    # Loop through each channel and bin
+    # Standard bin arrays are frame-major; rearrange them channel-outer and C-contiguous in
+    # one copy so each channel below streams as a contiguous (num_bins, num_frames) slab,
+    # matching the layout the kymograph path already uses
+    if analysis_type == 'standard':
+        bin_values = np.ascontiguousarray(bin_values.transpose(1, 2, 0))
+
+    # Loop through each channel
     for channel in range(num_channels):
-        for bin in range(num_bins):
-            # Extract the bin values for the current channel and bin
-            signal = bin_values[:, channel, bin] if analysis_type == 'standard' else bin_values[channel, bin]
-            # Calculate and store the individual ACF for the current channel and bin
-            acf_curve = calc_indv_ACF(signal=signal, num_frames=num_frames, peak_thresh=acf_peak_thresh)
-            indv_acfs[channel, bin] = acf_curve
+        # Calculate the ACF for every bin of the current channel in one batched call
+        indv_acfs[channel] = calc_ACF_curves_batch(signals=bin_values[channel], num_frames=num_frames, peak_thresh=acf_peak_thresh)
 
     return indv_acfs
 
+def calc_ACF_curves_batch(
+    signals: np.ndarray,
+    num_frames: int,
+    peak_thresh: float,
+) -> np.ndarray:
+    '''
+    Calculate Auto-Correlation Function (ACF) curves for a batch of signals at once.
+
+    Args:
+        signals (np.ndarray): A (num_signals, num_frames) array of signals.
+        num_frames (int): The number of frames in each signal.
+        peak_thresh (float): The peak prominence threshold for the ACF curves.
+
+    Returns:
+        np.ndarray: A (num_signals, num_frames * 2 - 1) array of ACF curves.
+    '''
+    # Calculate the reciprocal normalization in one pass; var() is the squared std without
+    # the sqrt round-trip, and dividing once here turns the per-curve normalization below
+    # into a single in-place multiply
+    inv_norm = 1.0 / (num_frames * signals.var(axis=1))
+
+    # Mean-center the signals straight into an explicit zero-padded work buffer at a
+    # 5-smooth transform length, so the transform reads it in place rather than padding
+    # into a hidden temporary (and no separate demeaned array is allocated)
+    n_fast = scipy.fft.next_fast_len(num_frames * 2 - 1, real=True)
+    work_dtype = signals.dtype if np.issubdtype(signals.dtype, np.floating) else np.float64
+    padded = np.zeros(shape=(signals.shape[0], n_fast), dtype=work_dtype)
+    np.subtract(signals, signals.mean(axis=1, keepdims=True), out=padded[:, :num_frames])
+
+    # Batched autocorrelation for every signal at once (Wiener-Khinchin): multiply each
+    # spectrum by its conjugate and invert the transform across all available cores
+    spectra = fft_backend.rfft(padded, axis=1, workers=-1)
+    full_corr = fft_backend.irfft(spectra * np.conj(spectra), n=n_fast, axis=1, workers=-1)
+
+    # Reorder from [0 .. max lag, padding, negative lags] to [-max lag .. max lag] and normalize
+    acf_curves = np.concatenate((full_corr[:, -(num_frames - 1):], full_corr[:, :num_frames]), axis=1)
+    np.multiply(acf_curves, inv_norm[:, None], out=acf_curves)
+
+    # Invalidate curves with less than two detectable peaks. The ACF is symmetric about lag
+    # zero and lag zero is its maximum, so off-center peaks come in mirrored pairs with the
+    # same prominence on either side: two peaks in the full curve is exactly one peak in the
+    # non-negative-lag half, which halves the bytes each search scans. The vectorized
+    # sign-scan prescreen rules out halves that cannot hold a peak before paying for find_peaks
+    half_curves = acf_curves[:, num_frames - 1:]
+    diffs = np.diff(half_curves, axis=1)
+    candidates = np.any(diffs > 0, axis=1) & np.any(diffs < 0, axis=1)
+    for row in range(acf_curves.shape[0]):
+        if candidates[row]:
+            peaks, _ = sig.find_peaks(half_curves[row], prominence=peak_thresh)
+            if len(peaks) >= 1:
+                continue
+        acf_curves[row] = np.nan
+
+    return acf_curves
+
 def calc_indv_ACF(
     signal: np.ndarray,
     num_frames: int,
@@ -126,23 +195,97 @@ def calc_indv_CCF_workflow(
 
     # Initialize array to store the individual CCFs
     indv_ccfs = np.zeros(shape=(num_combos, num_bins, num_frames*2-1))
-    
-    # Loop through each combination of channels and bin
+
+    # Standard bin arrays are frame-major; rearrange them channel-outer and C-contiguous in
+    # one copy so each channel streams as a contiguous (num_bins, num_frames) slab rather
+    # than paying a strided transpose copy per channel combination
+    if analysis_type == 'standard':
+        bin_values = np.ascontiguousarray(bin_values.transpose(1, 2, 0))
+
+    # Loop through each combination of channels
     for combo_number, combo in enumerate(channel_combos):
-        for bin in range(num_bins):
-            # Extract the bin values for the current channel and bin
-            if analysis_type == 'standard':
-                signal1 = sig.savgol_filter(bin_values[:, combo[0], bin], window_length=11, polyorder=3)
-                signal2 = sig.savgol_filter(bin_values[:, combo[1], bin], window_length=11, polyorder=3)
-            else:
-                signal1 = sig.savgol_filter(bin_values[combo[0], bin], window_length=11, polyorder=3)
-                signal2 = sig.savgol_filter(bin_values[combo[1], bin], window_length=11, polyorder=3)
-            # Calculate and store the individual CCF for the current combination of channels and bin
-            ccf = calc_indv_CCF(signal1=signal1, signal2=signal2, num_frames=num_frames)
-            indv_ccfs[combo_number, bin] = ccf
+        # Smooth every bin trace of each channel in the combination in one filter pass
+        signals1 = sig.savgol_filter(bin_values[combo[0]], window_length=11, polyorder=3, axis=1)
+        signals2 = sig.savgol_filter(bin_values[combo[1]], window_length=11, polyorder=3, axis=1)
+
+        # Calculate the CCFs for every bin of the combination in one batched call
+        indv_ccfs[combo_number] = calc_CCF_curves_batch(signals1=signals1, signals2=signals2, num_frames=num_frames)
 
     return indv_ccfs
 
+def calc_CCF_curves_batch(
+    signals1: np.ndarray,
+    signals2: np.ndarray,
+    num_frames: int,
+) -> np.ndarray:
+    '''
+    Calculate cross-correlation function (CCF) curves for a batch of smoothed signal pairs at once.
+
+    Args:
+        signals1 (np.ndarray): A (num_signals, num_frames) array of smoothed signals.
+        signals2 (np.ndarray): A (num_signals, num_frames) array of smoothed signals.
+        num_frames (int): The number of frames in each signal.
+
+    Returns:
+        np.ndarray: A (num_signals, num_frames * 2 - 1) array of CCF curves.
+    '''
+    num_signals = signals1.shape[0]
+    cc_curves = np.full(shape=(num_signals, num_frames * 2 - 1), fill_value=np.nan)
+
+    # Screen each signal pair before correlating: skip pairs where either signal is
+    # monotonic or where no sufficiently prominent peaks are found in one of the signals
+    valid = np.zeros(num_signals, dtype=bool)
+    for row in range(num_signals):
+        signal1 = signals1[row]
+        signal2 = signals2[row]
+        if not (signal_may_have_peaks(signal1) and signal_may_have_peaks(signal2)):
+            continue
+        peaks1, _ = sig.find_peaks(signal1, prominence=(np.max(signal1)-np.min(signal1))*0.25)
+        peaks2, _ = sig.find_peaks(signal2, prominence=(np.max(signal2)-np.min(signal2))*0.25)
+        valid[row] = len(peaks1) > 0 and len(peaks2) > 0
+    if not np.any(valid):
+        return cc_curves
+
+    # Fancy indexing already copies the valid rows, so mean-center those copies in place and
+    # fold the normalization terms into one reciprocal before the transforms
+    demeaned1 = signals1[valid]
+    demeaned2 = signals2[valid]
+    inv_norm = 1.0 / (num_frames * demeaned1.std(axis=1) * demeaned2.std(axis=1))
+    demeaned1 -= demeaned1.mean(axis=1, keepdims=True)
+    demeaned2 -= demeaned2.mean(axis=1, keepdims=True)
+
+    # Batched cross-correlation for every valid pair at once: stage each side in one
+    # reusable zero-padded work buffer at a 5-smooth transform length, multiply each
+    # spectrum by the conjugate of its partner, and invert the transform across all cores
+    n_fast = scipy.fft.next_fast_len(num_frames * 2 - 1, real=True)
+    work_dtype = demeaned1.dtype if np.issubdtype(demeaned1.dtype, np.floating) else np.float64
+    padded = np.zeros(shape=(demeaned1.shape[0], n_fast), dtype=work_dtype)
+    padded[:, :num_frames] = demeaned1
+    spectra1 = fft_backend.rfft(padded, axis=1, workers=-1)
+    padded[:, :num_frames] = demeaned2
+    spectra2 = fft_backend.rfft(padded, axis=1, workers=-1)
+    full_corr = fft_backend.irfft(spectra1 * np.conj(spectra2), n=n_fast, axis=1, workers=-1)
+
+    # Reorder from [0 .. max lag, padding, negative lags] to [-max lag .. max lag], then
+    # smooth and normalize every curve in one pass
+    curves = np.concatenate((full_corr[:, -(num_frames - 1):], full_corr[:, :num_frames]), axis=1)
+    curves = sig.savgol_filter(curves, window_length=11, polyorder=3, axis=1)
+    np.multiply(curves, inv_norm[:, None], out=curves)
+
+    # Invalidate curves with less than two detectable peaks. The vectorized sign-scan
+    # prescreen rules out rows that cannot hold two peaks before paying for find_peaks
+    candidates = rows_may_have_two_peaks(curves)
+    for row in range(curves.shape[0]):
+        if candidates[row]:
+            peaks, _ = sig.find_peaks(curves[row], prominence=0.1)
+            if len(peaks) >= 2:
+                continue
+        curves[row] = np.nan
+
+    cc_curves[valid] = curves
+
+    return cc_curves
+
 def calc_indv_CCF(
     signal1: np.ndarray,
     signal2: np.ndarray,
@@ -151,6 +294,11 @@ def calc_indv_CCF(
     '''
     Space saving function to calculate individual cross-correlation functions (CCFs) for each combination of channels and bins.
     '''
+    # Cheap sign-score prescreen: a monotonic signal cannot contain a peak, so the more
+    # expensive scipy peak searches can be skipped outright for flat or drifting bins
+    if not (signal_may_have_peaks(signal1) and signal_may_have_peaks(signal2)):
+        return np.full((num_frames * 2 - 1), np.nan)
+
     # Find peaks in the signals
     peaks1, _ = sig.find_peaks(signal1, prominence=(np.max(signal1)-np.min(signal1))*0.25)
     peaks2, _ = sig.find_peaks(signal2, prominence=(np.max(signal2)-np.min(signal2))*0.25)
@@ -160,8 +308,14 @@ def calc_indv_CCF(
         # Subtract the mean from the signals
         corr_signal1 = signal1 - signal1.mean()
         corr_signal2 = signal2 - signal2.mean()
-        # Calculate cross-correlation curve
-        cc_curve = np.correlate(corr_signal1, corr_signal2, mode='full')
+        # Calculate cross-correlation curve. Short traces are dominated by FFT setup cost
+        # (compute-bound on the transform bookkeeping, not the multiplies), so use the direct
+        # sum below a length threshold; longer traces win with the O(n log n) FFT path, where
+        # reversing the second signal turns the convolution into a cross-correlation
+        if num_frames < 128:
+            cc_curve = np.correlate(corr_signal1, corr_signal2, mode='full')
+        else:
+            cc_curve = sig.fftconvolve(corr_signal1, corr_signal2[::-1], mode='full')
 
         # Normalize the cross-correlation curve
         cc_curve = sig.savgol_filter(cc_curve, window_length=11, polyorder=3)
@@ -233,6 +387,29 @@ def calc_indv_shift(cc_curve: np.ndarray) -> np.ndarray:
     
     return delay_frames
 
+def rows_may_have_two_peaks(curves: np.ndarray) -> np.ndarray:
+    '''
+    Vectorized check for which rows of a curve matrix can contain at least two peaks.
+
+    Every interior peak needs at least one strictly rising step into it and one strictly
+    falling step out of it, so a row with fewer than two rises or two falls in its first
+    differences cannot hold two peaks and the prominence-based peak search can be skipped.
+    '''
+    diffs = np.diff(curves, axis=1)
+
+    return (np.count_nonzero(diffs > 0, axis=1) >= 2) & (np.count_nonzero(diffs < 0, axis=1) >= 2)
+
+def signal_may_have_peaks(signal: np.ndarray) -> bool:
+    '''
+    Branchless check for whether a signal can contain an interior peak.
+
+    Uses the sign of the first differences: a signal that never rises or never falls
+    cannot contain a local maximum, so callers can skip the peak search entirely.
+    '''
+    diff_signs = np.sign(np.diff(signal))
+
+    return bool(np.any(diff_signs > 0) and np.any(diff_signs < 0))
+
 def small_shifts_correction(
     delay_frames: float, 
     average_period: float
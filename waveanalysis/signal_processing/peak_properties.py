@@ -2,7 +2,7 @@ import warnings
 import numpy as np
 import scipy.signal as sig
 
-warnings.filterwarnings("ignore") # Ignore warnings
+from .correlation_functions import signal_may_have_peaks
 
 def calc_indv_peak_props_workflow(
     bin_values:np.ndarray,
@@ -35,82 +35,101 @@ def calc_indv_peak_props_workflow(
     indv_peak_offsets = np.zeros(shape=(num_channels, num_bins))
     indv_peak_props = {}
 
-    # Loop through each channel and bin
-    for channel in range(num_channels):
-        for bin in range(num_bins):
-            # Extract the bin values for the current channel and bin
-            signal = bin_values[:, channel, bin] if analysis_type == 'standard' else bin_values[channel, bin]
-            signal = sig.savgol_filter(signal, window_length = 11, polyorder = 2)                 
-            peaks, _ = sig.find_peaks(signal, prominence=(np.max(signal)-np.min(signal))*0.1)
-
-            # If peaks detected, calculate properties, otherwise return NaNs
-            if len(peaks) > 0:
-                # Calculate the peak properties
-                widths, heights, leftIndex, rightIndex = sig.peak_widths(signal, peaks, rel_height=0.5)
-                proms, _, _ = sig.peak_prominences(signal, peaks)
-
-                # Calculate the mean of the peak widths, maximums, and minimums
-                mean_width = np.mean(widths, axis=0)
-                mean_max = np.mean(signal[peaks], axis = 0)
-                mean_min = np.mean(signal[peaks]-proms, axis = 0)
-
-                # calculate the left and right bases of the peaks, then midpoints and peak offsets
-                _, _, left_bases, right_bases = sig.peak_widths(signal, peaks, rel_height=.99)
-                midpoints = (leftIndex + rightIndex) / 2
-                peak_offsets = peaks - midpoints
-
-                # Check if one peak entirely encompasses another
-                for i in range(len(peaks)):
-                    for j in range(len(peaks)):
-                        if i != j:  # Avoid self-comparison
-                            if left_bases[j] >= left_bases[i] and right_bases[j] <= right_bases[i]:
-                                # Peak j is entirely encompassed by peak i
-                                left_bases[i] = np.nan
-                                right_bases[i] = np.nan
-                                peak_offsets[i] = np.nan
-                                midpoints[i] = np.nan
+    # Standard bin arrays are frame-major; rearrange them channel-outer and C-contiguous in
+    # one copy so each channel streams as a contiguous (num_bins, num_frames) slab
+    if analysis_type == 'standard':
+        bin_values = np.ascontiguousarray(bin_values.transpose(1, 2, 0))
+
+    # NumPy and SciPy emit RuntimeWarnings for bins without usable peaks; silence them for
+    # this calculation only instead of disabling warnings for every importer of this module
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+
+        # Loop through each channel and bin
+        for channel in range(num_channels):
+            # Smooth every bin trace for the current channel in a single sliding-window pass
+            smoothed_signals = sig.savgol_filter(bin_values[channel], window_length = 11, polyorder = 2, axis = 1)
+
+            # Sign-scan every smoothed trace at once: a trace that never rises or never
+            # falls cannot hold a peak, so the peak search below can be skipped for it
+            diffs = np.diff(smoothed_signals, axis=1)
+            bins_with_candidates = np.any(diffs > 0, axis=1) & np.any(diffs < 0, axis=1)
+            for bin in range(num_bins):
+                # Extract the smoothed bin values for the current channel and bin
+                signal = smoothed_signals[bin]
+                if bins_with_candidates[bin]:
+                    peaks, _ = sig.find_peaks(signal, prominence=(np.max(signal)-np.min(signal))*0.1)
+                else:
+                    peaks = []
+
+                # If peaks detected, calculate properties, otherwise return NaNs
+                if len(peaks) > 0:
+                    # Calculate the peak properties
+                    widths, heights, leftIndex, rightIndex = sig.peak_widths(signal, peaks, rel_height=0.5)
+                    proms, _, _ = sig.peak_prominences(signal, peaks)
+
+                    # Calculate the mean of the peak widths, maximums, and minimums
+                    mean_width = np.mean(widths, axis=0)
+                    mean_max = np.mean(signal[peaks], axis = 0)
+                    mean_min = np.mean(signal[peaks]-proms, axis = 0)
+
+                    # calculate the left and right bases of the peaks, then midpoints and peak offsets
+                    _, _, left_bases, right_bases = sig.peak_widths(signal, peaks, rel_height=.99)
+                    midpoints = (leftIndex + rightIndex) / 2
+                    peak_offsets = peaks - midpoints
+
+                    # Check if one peak entirely encompasses another
+                    for i in range(len(peaks)):
+                        for j in range(len(peaks)):
+                            if i != j:  # Avoid self-comparison
+                                if left_bases[j] >= left_bases[i] and right_bases[j] <= right_bases[i]:
+                                    # Peak j is entirely encompassed by peak i
+                                    left_bases[i] = np.nan
+                                    right_bases[i] = np.nan
+                                    peak_offsets[i] = np.nan
+                                    midpoints[i] = np.nan
                 
-                # Drop NaN values because it will mess up the mean calculation
-                valid_indices = ~np.isnan(peak_offsets)
-                valid_offsets = peak_offsets[valid_indices]
-
-                # Calculate the mean of valid peak offsets
-                mean_offset = np.nanmean(valid_offsets)
-            else:
-                # If no peaks detected, return NaNs
-                mean_width = np.nan
-                mean_max = np.nan
-                mean_min = np.nan
-                mean_offset = np.nan
-                peaks = np.nan
-                proms = np.nan 
-                heights = np.nan
-                leftIndex = np.nan
-                rightIndex = np.nan
-                midpoints = np.nan
-                peak_offsets = np.nan
-                left_bases = np.nan
-                right_bases = np.nan
-
-            # Store the mean peak properties in the arrays
-            indv_peak_widths[channel, bin] = mean_width
-            indv_peak_maxs[channel, bin] = mean_max
-            indv_peak_mins[channel, bin] = mean_min
-            indv_peak_offsets[channel, bin] = mean_offset
-
-            # Store the individual peak properties in the dictionary
-            indv_peak_props[f'Ch {channel} Bin {bin}'] = {'smoothed': signal, 
-                                                                'peaks': peaks,
-                                                                'proms': proms, 
-                                                                'heights': heights, 
-                                                                'leftIndex': leftIndex, 
-                                                                'rightIndex': rightIndex,
-                                                                'midpoints': midpoints,
-                                                                'peak_offsets': peak_offsets,
-                                                                'left_base': left_bases,
-                                                                'right_base': right_bases}
+                    # Drop NaN values because it will mess up the mean calculation
+                    valid_indices = ~np.isnan(peak_offsets)
+                    valid_offsets = peak_offsets[valid_indices]
+
+                    # Calculate the mean of valid peak offsets
+                    mean_offset = np.nanmean(valid_offsets)
+                else:
+                    # If no peaks detected, return NaNs
+                    mean_width = np.nan
+                    mean_max = np.nan
+                    mean_min = np.nan
+                    mean_offset = np.nan
+                    peaks = np.nan
+                    proms = np.nan 
+                    heights = np.nan
+                    leftIndex = np.nan
+                    rightIndex = np.nan
+                    midpoints = np.nan
+                    peak_offsets = np.nan
+                    left_bases = np.nan
+                    right_bases = np.nan
+
+                # Store the mean peak properties in the arrays
+                indv_peak_widths[channel, bin] = mean_width
+                indv_peak_maxs[channel, bin] = mean_max
+                indv_peak_mins[channel, bin] = mean_min
+                indv_peak_offsets[channel, bin] = mean_offset
+
+                # Store the individual peak properties in the dictionary
+                indv_peak_props[f'Ch {channel} Bin {bin}'] = {'smoothed': signal, 
+                                                                    'peaks': peaks,
+                                                                    'proms': proms, 
+                                                                    'heights': heights, 
+                                                                    'leftIndex': leftIndex, 
+                                                                    'rightIndex': rightIndex,
+                                                                    'midpoints': midpoints,
+                                                                    'peak_offsets': peak_offsets,
+                                                                    'left_base': left_bases,
+                                                                    'right_base': right_bases}
                         
-                        # TODO: rename the keys to be more descriptive
+                            # TODO: rename the keys to be more descriptive
     
     return indv_peak_widths, indv_peak_maxs, indv_peak_mins, indv_peak_offsets, indv_peak_props
 
@@ -125,7 +144,10 @@ def calc_indv_peak_props_rolling(signal: np.ndarray) -> tuple:
         tuple: A tuple containing the mean width, mean maximum, mean minimum, and mean offset of the peaks. If no peaks are detected, NaN values are returned.
     '''
     # Calculate the peak properties
-    signal = sig.savgol_filter(signal, window_length = 11, polyorder = 2)                 
+    signal = sig.savgol_filter(signal, window_length = 11, polyorder = 2)
+    # Skip the peak search outright for traces that never rise or never fall
+    if not signal_may_have_peaks(signal):
+        return np.nan, np.nan, np.nan, np.nan
     peaks, _ = sig.find_peaks(signal, prominence=(np.max(signal)-np.min(signal))*0.1)
 
     # If peaks detected, calculate properties, otherwise return NaNs
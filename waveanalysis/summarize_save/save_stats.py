@@ -1,5 +1,4 @@
 import os
-import csv
 import numpy as np
 import pandas as pd
 from itertools import zip_longest
@@ -23,6 +22,10 @@ def save_parameter_means_to_csv(
     parameter_tables_dict = {}
     parameters_to_extract = [column for column in summary_df.columns if 'Mean' in column]
 
+    # The group row selection only depends on the group name, so run the substring match
+    # once per group here instead of once per (parameter, group) pair in the loops below
+    group_rows = {group_name: summary_df.loc[summary_df['File Name'].str.contains(group_name)] for group_name in group_names}
+
     # extract the mean values for each group
     for parameter in parameters_to_extract:
         # create a dataframe to store the mean values for each group
@@ -31,7 +34,7 @@ def save_parameter_means_to_csv(
 
         # extract the mean values for each group
         for group_name in group_names:
-            group_data = summary_df.loc[summary_df['File Name'].str.contains(group_name)]
+            group_data = group_rows[group_name]
             values = group_data[parameter].tolist()
             df_to_concat = pd.DataFrame({'Data Type': parameter, 'Group Name': group_name, 'Value': values})
             # concatenate the dataframes
@@ -115,10 +118,18 @@ def get_indv_CCF_values(
 
     # Loop through each channel combination and bin
     for combo_number, combo in enumerate(channel_combos):
-        for bin in range(num_bins):      
+        # Resolve the bin-value layout once per combo instead of re-testing the analysis
+        # type for every bin; both views index as (bin, frame) below
+        if analysis_type == "standard":
+            combo_values_1 = bin_values[:, combo[0]].T
+            combo_values_2 = bin_values[:, combo[1]].T
+        else:
+            combo_values_1 = bin_values[combo[0]]
+            combo_values_2 = bin_values[combo[1]]
+        for bin in range(num_bins):
             # Save the individual bin values
-            to_plot1 = bin_values[:, combo[0], bin] if analysis_type == "standard" else bin_values[combo[0], bin]
-            to_plot2 = bin_values[:, combo[1], bin] if analysis_type == "standard" else bin_values[combo[1], bin]
+            to_plot1 = combo_values_1[bin]
+            to_plot2 = combo_values_2[bin]
             # Create a list of tuples containing the time, channel 1 value, channel 2 value, and CCF value
             ccf_curve = indv_ccfs[combo_number, bin]
             arr_list = [i * frame_interval for i in range(len(ccf_curve))]
@@ -159,12 +170,16 @@ def determine_structure_and_values(measurements: Union[List[Tuple], List[List]])
 
 def write_to_csv(file_path: str, headers: List[str], data: List[Tuple]) -> None:
     '''
-    Write the headers and data to a CSV file.
+    Write the headers and data to a CSV file in a single buffered write.
     '''
-    with open(file_path, 'w', newline='') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(headers)
-        writer.writerows(data)
+    # The rows only ever hold numbers and the None padding from zip_longest, so the csv
+    # module's quoting machinery is unnecessary: format everything into one string and
+    # write it in one call through a large buffer. The \r\n terminator matches the csv
+    # module's default dialect, keeping the files byte-identical
+    lines = [','.join(headers)]
+    lines.extend(','.join('' if value is None else str(value) for value in row) for row in data)
+    with open(file_path, 'w', newline='', buffering=1<<20) as csvfile:
+        csvfile.write('\r\n'.join(lines) + '\r\n')
 
 def normalize_signal(signal: np.ndarray) -> np.ndarray:
     '''
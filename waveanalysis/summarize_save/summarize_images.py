@@ -1,6 +1,16 @@
+import math
 import numpy as np
 import pandas as pd
 
+# Bottleneck provides much faster compiled nan-aware reductions (nanmedian especially),
+# so route the summary statistics through it when it is installed and quietly fall back
+# to the equivalent numpy implementations when it is not
+try:
+    import bottleneck as bn
+    nanmean, nanmedian, nanstd = bn.nanmean, bn.nanmedian, bn.nanstd
+except ImportError:
+    nanmean, nanmedian, nanstd = np.nanmean, np.nanmedian, np.nanstd
+
 def summarize_image(
     img_parameters: dict,
     img_props_dict: dict
@@ -25,34 +35,43 @@ def summarize_image(
     col_names = ["Parameter", "Mean", "Median", "StdDev", "SEM"]
     col_names.extend([f'Bin {i}' for i in range(num_bins)])
 
-    # combine all the statified measurements into a single list
-    im_measurements = []
     parameter_with_stats_dict = {}
 
     if 'num_submovies' in img_props_dict:
         num_submovies = img_props_dict['num_submovies']
 
+        # list to collect the per-submovie measurement dataframes
+        im_measurements = []
+
+        # Reduce every parameter across all submovies in one nan-aware pass per statistic
+        # here, rather than re-scanning one submovie slice per iteration of the loop below
+        param_stats = {
+            parameter: (nanmean(parameter_measurements, axis=2), nanmedian(parameter_measurements, axis=2), nanstd(parameter_measurements, axis=2))
+            for parameter, parameter_measurements in img_parameters.items()
+        }
+
         # insert Mean, Median, StdDev, and SEM into the beginning of each list
         for submovie in range(num_submovies):
             statified_measurements = []
             for parameter, parameter_measurements in img_parameters.items():
-                parameter_with_stats = add_stats_for_parameter(parameter_measurements[submovie], parameter, num_channels, channel_combos)
-                for channel_combo_stat in parameter_with_stats:
-                    statified_measurements.append(channel_combo_stat)
+                meas_means, meas_medians, meas_stds = param_stats[parameter]
+                parameter_with_stats = add_stats_for_parameter(parameter_measurements[submovie], parameter, num_channels, channel_combos,
+                                                               precomputed_stats=(meas_means[submovie], meas_medians[submovie], meas_stds[submovie]))
+                statified_measurements.extend(parameter_with_stats)
 
             # create a dataframe from the statified measurements
             submovie_meas_df = pd.DataFrame(statified_measurements, columns = col_names)
             im_measurements.append(submovie_meas_df)
     else:
         # insert Mean, Median, StdDev, and SEM into the beginning of each list
+        statified_measurements = []
         for parameter, parameter_measurements in img_parameters.items():
             parameter_with_stats = add_stats_for_parameter(parameter_measurements, parameter, num_channels, channel_combos)
             parameter_with_stats_dict[parameter] = parameter_with_stats
-            for channel_combo_stat in parameter_with_stats:
-                im_measurements.append(channel_combo_stat)
+            statified_measurements.extend(parameter_with_stats)
 
         # create a dataframe from the statified measurements
-        im_measurements = pd.DataFrame(im_measurements, columns = col_names)
+        im_measurements = pd.DataFrame(statified_measurements, columns = col_names)
 
     return im_measurements, parameter_with_stats_dict
 
@@ -60,7 +79,8 @@ def add_stats_for_parameter(
     measurements: np.ndarray,
     measurement_name: str,
     num_channels: int,
-    channel_combos: list = None
+    channel_combos: list = None,
+    precomputed_stats: tuple = None
 ) -> list:
     '''
     Calculate statistics for a given measurement parameter.
@@ -70,6 +90,8 @@ def add_stats_for_parameter(
         measurement_name (str): Name of the measurement parameter.
         num_channels (int): Number of channels.
         channel_combos (list, optional): List of channel combinations. Defaults to None.
+        precomputed_stats (tuple, optional): Mean, median, and standard deviation arrays
+            already reduced along the bin axis. Defaults to None.
 
     Returns:
         list: List of statistics for the measurement parameter.
@@ -77,29 +99,44 @@ def add_stats_for_parameter(
     statified = []
 
     def calculate_statistics(measurements_subset, channel_label):
-        meas_mean = np.nanmean(measurements_subset)
-        meas_median = np.nanmedian(measurements_subset)
-        meas_std = np.nanstd(measurements_subset)
-        meas_sem = meas_std / np.sqrt(len(measurements_subset))
-        if isinstance(measurements_subset, np.ndarray):
-            measurements_subset = measurements_subset.tolist()
-        return [channel_label, meas_mean, meas_median, meas_std, meas_sem] + measurements_subset
+        # Drop the NaNs in a single pass here so the mean, median, and std below each scan
+        # the compressed array directly instead of re-deriving the same mask three times
+        measurements_subset = np.asarray(measurements_subset, dtype=float)
+        valid = measurements_subset[~np.isnan(measurements_subset)]
+        if valid.size > 0:
+            meas_mean = valid.mean()
+            # valid is a fresh copy, so the median can partition it in place rather than
+            # sorting yet another temporary; the reordering doesn't affect mean or std
+            meas_median = np.median(valid, overwrite_input=True)
+            meas_std = valid.std()
+        else:
+            meas_mean = meas_median = meas_std = np.nan
+        meas_sem = meas_std / math.sqrt(len(measurements_subset))
+        return [channel_label, meas_mean, meas_median, meas_std, meas_sem] + measurements_subset.tolist()
 
     if measurement_name not in ['Wave Speed']:
+        # Calculate the summary statistics for every channel (or channel combination) in one
+        # vectorized pass along the bin axis, unless the caller already batched them
+        if precomputed_stats is None:
+            meas_means = nanmean(measurements, axis=1)
+            meas_medians = nanmedian(measurements, axis=1)
+            meas_stds = nanstd(measurements, axis=1)
+        else:
+            meas_means, meas_medians, meas_stds = precomputed_stats
+        meas_sems = meas_stds / math.sqrt(measurements.shape[1])
+
         for index, item in enumerate(channel_combos if measurement_name in ['Shift', '% Phase Shift'] else range(num_channels)):
             if measurement_name in ['Shift', '% Phase Shift']:
-                measurements_subset = measurements[index]
                 channel_label = f'Ch{channel_combos[index][0]+1}-Ch{channel_combos[index][1]+1} {measurement_name}'
             else:
-                measurements_subset = measurements[item]
                 channel_label = f'Ch {item + 1} {measurement_name}'
-            
-            statified.append(calculate_statistics(measurements_subset, channel_label))
+
+            statified.append([channel_label, meas_means[index], meas_medians[index], meas_stds[index], meas_sems[index]] + measurements[index].tolist())
 
     else:
         measurements = calculate_statistics(measurements, measurement_name)
         statified.append(measurements)
-        
+
     return statified
 
 def combine_stats_for_image_kymo_standard(
@@ -169,7 +206,6 @@ def combine_stats_for_image_kymo_standard(
         # Wave Speed is a single value, so it doesn't need to be separated by channel
         elif name in ['Wave Speed']:
             for ind, stat in enumerate(stats_location):
-                print(parameters_with_stats_dict[name])
                 file_data_summary[f'{stat} {name}'] = parameters_with_stats_dict[name][0][ind + 1]
 
     return file_data_summary
@@ -204,49 +240,52 @@ def combine_stats_rolling(
     # Define the statistics to calculate
     stat_name_and_func = {'Mean' : np.nanmean,
                             'Median' : np.nanmedian,
-                            'StdDev' : np.nanstd                            
+                            'StdDev' : np.nanstd
                         }
-    
-    # Extract image properties from the dictionary
-    all_submovie_summary = []
-    
-    # Loop through each submovie
-    for submovie in range(num_submovies):
-        # Initialize dictionary to store the summary for the current submovie
-        submovie_summary = {'Submovie': submovie + 1}
-
-        # Calculate percentage of no shifts for each channel combination
-        if num_channels > 1:
-            indv_shifts = img_parameters_dict['Shift']
-            indv_phase_shifts = img_parameters_dict['% Phase Shift']
-            for combo_number, combo in enumerate(channel_combos):
-                pcnt_no_shift = np.count_nonzero(np.isnan(indv_ccfs[submovie, combo_number])) / num_bins * 100
-                submovie_summary[f'Ch{combo[0] + 1}-Ch{combo[1] + 1} Pcnt No Shifts'] = pcnt_no_shift
-                for stat_name, func in stat_name_and_func.items():
-                    submovie_summary[f'Ch{combo[0] + 1}-Ch{combo[1] + 1} {stat_name} Shift'] = func(indv_shifts[submovie, combo_number])
-                # Unnecessary for loop to add stats for % Phase Shift after the Shifts
-                for stat_name, func in stat_name_and_func.items():
-                    submovie_summary[f'Ch{combo[0] + 1}-Ch{combo[1] + 1} {stat_name} % Phase Shift'] = func(indv_phase_shifts[submovie, combo_number])
-
-        # Calculate statistics for each channel
-        for channel in range(num_channels):
-            # Calculate percentage of no periods for the current channel
-            pcnt_no_period = (np.count_nonzero(np.isnan(indv_periods[submovie, channel])) / num_bins) * 100
-            submovie_summary[f'Ch {channel + 1} Pcnt No Periods'] = pcnt_no_period
-            
-            # Calculate percentage of no peaks for the current channel
-            pcnt_no_peaks = np.count_nonzero(np.isnan(indv_peak_widths[submovie, channel])) / num_bins * 100
-            submovie_summary[f'Ch {channel + 1} Pcnt No Peaks'] = pcnt_no_peaks
-            
-            # Calculate statistics for other parameters excluding Shift and Period
-            for name, measurements in img_parameters_dict.items():
-                if name != 'Shift':
-                    for stat_name, func in stat_name_and_func.items():
-                        submovie_summary[f'Ch {channel + 1} {stat_name} {name}'] = func(measurements[submovie, channel])
-
-        all_submovie_summary.append(submovie_summary)
-    
-    col_names = [key for key in all_submovie_summary[0].keys()]
-    full_movie_summary = pd.DataFrame(all_submovie_summary, columns = col_names)
-            
+
+    # Precompute every statistic for every parameter in one vectorized pass along the bin
+    # axis, rather than re-scanning each (submovie, channel) row once per statistic below
+    param_stats = {
+        name: {stat_name: func(measurements, axis=2) for stat_name, func in stat_name_and_func.items()}
+        for name, measurements in img_parameters_dict.items()
+    }
+
+    # Count the bins without a measurement for every submovie in one vectorized isnan pass
+    # instead of re-counting one (submovie, channel) slice at a time inside the loop below
+    pcnt_no_periods = np.count_nonzero(np.isnan(indv_periods), axis=2) / num_bins * 100
+    pcnt_no_peaks = np.count_nonzero(np.isnan(indv_peak_widths), axis=2) / num_bins * 100
+    if num_channels > 1:
+        pcnt_no_shifts = np.count_nonzero(np.isnan(indv_ccfs), axis=(2, 3)) / num_bins * 100
+
+    # Column labels for each channel combination and channel
+    combo_labels = [f'Ch{combo[0] + 1}-Ch{combo[1] + 1}' for combo in channel_combos]
+    channel_labels = [f'Ch {channel + 1}' for channel in range(num_channels)]
+
+    # Every precomputed statistic is already a vector across the submovie axis, so hand the
+    # columns to pandas directly instead of packing one dict of scalars per submovie and
+    # having the DataFrame constructor unpack them again. Insertion order below matches the
+    # column order the per-submovie loop used to produce
+    summary_cols = {'Submovie': np.arange(1, num_submovies + 1)}
+
+    # Add the shift statistics for each channel combination
+    if num_channels > 1:
+        for combo_number, combo_label in enumerate(combo_labels):
+            summary_cols[f'{combo_label} Pcnt No Shifts'] = pcnt_no_shifts[:, combo_number]
+            for name in ['Shift', '% Phase Shift']:
+                for stat_name in stat_name_and_func:
+                    summary_cols[f'{combo_label} {stat_name} {name}'] = param_stats[name][stat_name][:, combo_number]
+
+    # Add the statistics for each channel
+    for channel, channel_label in enumerate(channel_labels):
+        summary_cols[f'{channel_label} Pcnt No Periods'] = pcnt_no_periods[:, channel]
+        summary_cols[f'{channel_label} Pcnt No Peaks'] = pcnt_no_peaks[:, channel]
+
+        # Add statistics for other parameters excluding Shift
+        for name in img_parameters_dict:
+            if name != 'Shift':
+                for stat_name in stat_name_and_func:
+                    summary_cols[f'{channel_label} {stat_name} {name}'] = param_stats[name][stat_name][:, channel]
+
+    full_movie_summary = pd.DataFrame(summary_cols)
+
     return full_movie_summary